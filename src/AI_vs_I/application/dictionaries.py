@@ -1,6 +1,10 @@
 # Color mapping for participants
 PARTICIPANT_COLORS = ["Red", "Blue", "Green", "Orange", "Purple"]
+# Set view of PARTICIPANT_COLORS for membership checks; keep the list for ordering
+PARTICIPANT_COLORS_SET = frozenset(PARTICIPANT_COLORS)
 HUMAN_COLOR = "Orange"
+# Colors played by AI participants, in PARTICIPANT_COLORS order
+AI_COLORS = tuple(color for color in PARTICIPANT_COLORS if color != HUMAN_COLOR)
 
 # Emoji mapping for participants
 COLOR_EMOJIS = {
@@ -20,3 +24,6 @@ AVAILABLE_GROQ_MODELS = [
     "openai/gpt-oss-120b",
     "openai/gpt-oss-20b",
 ]
+AVAILABLE_GROQ_MODELS_SET = frozenset(AVAILABLE_GROQ_MODELS)
+# Position of each model in AVAILABLE_GROQ_MODELS, e.g. for a selectbox index
+AVAILABLE_GROQ_MODELS_INDEX = {model: i for i, model in enumerate(AVAILABLE_GROQ_MODELS)}
@@ -1,10 +1,51 @@
+import asyncio
+import sys
+from collections import deque
+from collections.abc import Callable, Iterator
 from enum import Enum
 
 from langchain_core.prompts import ChatPromptTemplate
 
+from AI_vs_I.domain.prompts.prompt_templates import format_fast
 from AI_vs_I.infrastructure.monitoring.logger import Logger
 
 
+def _message_content(message) -> str | None:
+    """Return the content of a message given either as a dict or as a message object."""
+    # If it's a dict or an object with a 'content' attribute
+    if isinstance(message, dict):
+        return message.get("content", str(message))
+    return getattr(message, "content", str(message))
+
+
+def _extract_from_dict(response: dict) -> str:
+    """Extract the final message content from an agent state dict."""
+    if "messages" not in response:
+        return str(response)
+    messages = response["messages"]
+    last_msg = _message_content(messages[-1]) if messages else None
+    if last_msg is None:
+        last_msg = str(response)
+    return last_msg.strip()
+
+
+def _make_extractor(response) -> Callable[[object], str]:
+    """Pick the extractor for a response type; called once per type, then cached in _EXTRACTORS."""
+    if isinstance(response, dict):
+        return _extract_from_dict
+    # If response is a string, just strip it
+    if isinstance(response, str):
+        return str.strip
+    return str
+
+
+# Message types produced by the model itself when streaming (as opposed to user or tool messages)
+_AI_MESSAGE_TYPES = frozenset({"ai", "AIMessageChunk"})
+
+# Response extractors keyed by the agent response type, so the type checks run once per type
+_EXTRACTORS: dict[type, Callable[[object], str]] = {}
+
+
 class GamePhase(Enum):
     """Game phase enumeration."""
 
@@ -18,9 +59,22 @@ class GamePhase(Enum):
         return self.value
 
 
+class GameEvent(Enum):
+    """Moves a participant can make; the value completes the invalid-phase error message."""
+
+    ASK = "ask questions"
+    ANSWER = "answer questions"
+    GUESS = "make guesses"
+
+    def __str__(self):
+        return self.value
+
+
 class ParticipantState:
     """Tracks the state of a single participant."""
 
+    __slots__ = ("color", "is_human", "has_asked", "has_answered", "guess")
+
     def __init__(self, color: str, is_human: bool = False):
         """
         Initialize participant state.
@@ -78,6 +132,10 @@ class GameDynamics:
         if human_color not in participant_colors:
             raise ValueError(f"human_color '{human_color}' must be in participant_colors")
 
+        # Intern colors so dict lookups and comparisons against them hit the identity fast path
+        participant_colors = [sys.intern(color) for color in participant_colors]
+        human_color = sys.intern(human_color)
+
         self.logger = Logger.get_logger(__name__)
         self.participants: dict[str, ParticipantState] = {}
         self.human_color = human_color
@@ -85,12 +143,29 @@ class GameDynamics:
         self.phase = GamePhase.NOT_STARTED
         self.question_count = 0
         self.conversation_history: list[dict] = []
+        self._asked_count = 0
+        self._guess_count = 0
+        self._correct_guess_count = 0
+        # Incremental indices over the conversation history, kept in sync by record_question/record_answer
+        self._asked_targets: set[str] = set()
+        self._pending_answerers: deque[str] = deque()
+        self._pending_questions: dict[str, str] = {}
+        # Snapshots served to state readers, rebuilt lazily after the next mutation
+        self._cached_state: dict | None = None
+        self._history_snapshot: tuple[dict, ...] | None = None
+        # Questions and answers formatted for model prompts, shared by every model in this game
+        self._prompt_lines: list[str] = []
+        self._prompt_history: str | None = None
+        self._targets_cache: dict[str, list[str]] = {}
 
         # Initialize participants
         for color in participant_colors:
             self.participants[color] = ParticipantState(color, is_human=(color == human_color))
+        self._participant_colors: tuple[str, ...] = tuple(self.participants)
+        # Maps equal color strings to the interned participant keys
+        self._canonical_colors: dict[str, str] = {color: color for color in self._participant_colors}
 
-        self.logger.info(f"Game initialized with {len(self.participants)} participants. Human: Mr. {human_color}")
+        self.logger.info("Game initialized with %d participants. Human: Mr. %s", len(self.participants), human_color)
 
     def start_game(self, starting_participant: str):
         """
@@ -109,7 +184,8 @@ class GameDynamics:
 
         self.phase = GamePhase.ASKING_PHASE
         self.current_turn = starting_participant
-        self.logger.info(f"Game started! Mr. {starting_participant} goes first.")
+        self._invalidate_state()
+        self.logger.info("Game started! Mr. %s goes first.", starting_participant)
 
     def record_question(self, asker: str, target: str, question: str):
         """
@@ -123,35 +199,8 @@ class GameDynamics:
         Raises:
             ValueError: If the move is invalid (wrong phase, wrong turn, already asked, etc.).
         """
-        # Validate game state
-        if self.phase != GamePhase.ASKING_PHASE:
-            raise ValueError(f"Cannot ask questions in phase: {self.phase.value}")
-
-        # Validate asker
-        if asker not in self.participants:
-            raise ValueError(f"Invalid asker: {asker}")
-        if self.current_turn is not None and asker != self.current_turn:
-            raise ValueError(f"It's not Mr. {asker}'s turn (current turn: Mr. {self.current_turn})")
-        if self.participants[asker].has_asked:
-            raise ValueError(f"Mr. {asker} has already asked a question")
-
-        # Validate target
-        if target not in self.participants:
-            raise ValueError(f"Invalid target: {target}")
-        if asker == target:
-            raise ValueError("Cannot ask a question to yourself")
-
-        # Record the question
-        self.participants[asker].has_asked = True
-        self.question_count += 1
-        self.current_turn = target
-
-        # Add to conversation history
-        entry = {"asker": asker, "target": target, "question": question, "type": "question"}
-        self.conversation_history.append(entry)
-
-        self.logger.info(f"Mr. {asker} asked Mr. {target}: {question}")
-        self.phase = GamePhase.ANSWERING_PHASE
+        asker, target = self._canonical(asker), self._canonical(target)
+        self._transition(GameEvent.ASK)(self, asker, target, question)
 
     def record_answer(self, answerer: str, answer: str):
         """
@@ -164,42 +213,8 @@ class GameDynamics:
         Raises:
             ValueError: If the move is invalid (wrong phase, wrong turn, already answered, etc.).
         """
-        # Validate game state
-        if self.phase != GamePhase.ANSWERING_PHASE:
-            raise ValueError(f"Cannot answer questions in phase: {self.phase.value}")
-
-        # Validate answerer
-        if answerer not in self.participants:
-            raise ValueError(f"Invalid answerer: {answerer}")
-        if self.current_turn != answerer:
-            raise ValueError(f"It's not Mr. {answerer}'s turn to answer (current turn: Mr. {self.current_turn})")
-        if self.participants[answerer].has_answered:
-            raise ValueError(f"Mr. {answerer} has already answered a question")
-
-        # Record the answer
-        self.participants[answerer].has_answered = True
-
-        # Add to conversation history
-        entry = {"answerer": answerer, "answer": answer, "type": "answer"}
-        self.conversation_history.append(entry)
-
-        self.logger.info(f"Mr. {answerer} answered: {answer}")
-
-        # Update current_turn for next action
-        # If answerer hasn't asked yet, they should ask next (keep current_turn)
-        # Otherwise, find next person who needs to answer
-        if not self.participants[answerer].has_asked:
-            # Answerer will ask next, keep current_turn as is
-            pass
-        else:
-            # Find next person who has been asked a question but hasn't answered yet
-            self.current_turn = self._find_next_answerer()
-
-        # Check if question phase is complete
-        if self._is_q_and_a_phase_complete():
-            self._transition_to_guessing_phase()
-        else:
-            self.phase = GamePhase.ASKING_PHASE
+        answerer = self._canonical(answerer)
+        self._transition(GameEvent.ANSWER)(self, answerer, answer)
 
     def record_guess(self, guesser: str, guess: str, reasoning: str = ""):
         """
@@ -213,32 +228,8 @@ class GameDynamics:
         Raises:
             ValueError: If the move is invalid (wrong phase, invalid guess, etc.).
         """
-        # Validate game state
-        if self.phase != GamePhase.GUESSING_PHASE:
-            raise ValueError(f"Cannot make guesses in phase: {self.phase.value}")
-
-        # Validate guesser
-        if guesser not in self.participants:
-            raise ValueError(f"Invalid guesser: {guesser}")
-        if self.participants[guesser].guess is not None:
-            raise ValueError(f"Mr. {guesser} has already made a guess")
-
-        # Validate guess
-        if guess not in self.participants:
-            raise ValueError(f"Invalid guess target: {guess}")
-
-        # Record the guess
-        self.participants[guesser].guess = guess
-
-        # Add to conversation history
-        entry = {"guesser": guesser, "guess": guess, "reasoning": reasoning, "type": "guess"}
-        self.conversation_history.append(entry)
-
-        self.logger.info(f"Mr. {guesser} guessed Mr. {guess} is the human. Reasoning: {reasoning}")
-
-        # Check if all guesses are complete
-        if self._are_all_guesses_complete():
-            self.phase = GamePhase.FINISHED
+        guesser, guess = self._canonical(guesser), self._canonical(guess)
+        self._transition(GameEvent.GUESS)(self, guesser, guess, reasoning)
 
     def get_available_targets(self, curr_asker: str) -> list[str]:
         """
@@ -248,27 +239,28 @@ class GameDynamics:
         Args:
             curr_asker (str): The color of the participant who is asking the question.
         Returns:
-            list[str]: List of valid target participant colors.
+            list[str]: List of valid target participant colors, cached until the next move
+                (the UI asks again on every rerun); treat it as read-only.
         """
-        # Exclude self
-        possible_targets = [c for c in self.participants if c != curr_asker]
-
-        # Exclude those who have already been asked a question
+        targets = self._targets_cache.get(curr_asker)
+        if targets is None:
+            targets = self._targets_cache[curr_asker] = self._compute_available_targets(curr_asker)
+        return targets
+
+    def _compute_available_targets(self, curr_asker: str) -> list[str]:
+        """Apply the targeting rules for get_available_targets."""
+        # Exclude self and those who have already been asked a question
         # (each participant should be asked exactly once)
-        asked_targets = set()
-        for entry in self.conversation_history:
-            if entry["type"] == "question":
-                asked_targets.add(entry["target"])
-        possible_targets = [c for c in possible_targets if c not in asked_targets]
+        possible_targets = [c for c in self._participant_colors if c != curr_asker and c not in self._asked_targets]
 
         # For the first question, anyone can be asked
         if self.question_count == 0:
             return possible_targets
 
         # Determine if curr_asker is the last to ask (i.e., all others have asked)
-        others = [c for c in self.participants if c != curr_asker]
-        others_asked = [self.participants[c].has_asked for c in others]
-        is_last_asker = all(others_asked)
+        is_last_asker = (
+            self._asked_count == len(self._participant_colors) - 1 and not self.participants[curr_asker].has_asked
+        )
 
         if not is_last_asker:
             # Exclude those who have already asked (they've had their turn to ask)
@@ -281,10 +273,15 @@ class GameDynamics:
         """
         Get the current state of the game.
 
+        The returned dictionary is cached until the next move and must be treated as read-only.
+
         Returns:
             dict: Dictionary containing game state information.
         """
-        return {
+        if self._cached_state is not None:
+            return self._cached_state
+
+        self._cached_state = {
             "phase": self.phase.value,
             "current_turn": self.current_turn,
             "question_count": self.question_count,
@@ -299,15 +296,41 @@ class GameDynamics:
             },
             "conversation_history": self.conversation_history,
         }
+        return self._cached_state
 
-    def get_conversation_history(self) -> list[dict]:
+    def get_conversation_history(self) -> tuple[dict, ...]:
         """
         Get the conversation history.
 
         Returns:
-            list[dict]: List of conversation entries.
+            tuple[dict, ...]: Immutable snapshot of the conversation entries, cached until the next move.
+        """
+        if self._history_snapshot is None:
+            self._history_snapshot = tuple(self.conversation_history)
+        return self._history_snapshot
+
+    def get_prompt_history(self) -> str:
+        """
+        Get the questions and answers so far, formatted for model prompts; guesses are left out.
+
+        Returns:
+            str: One line per question or answer, cached until the next move. Empty before the first question.
+        """
+        if self._prompt_history is None:
+            self._prompt_history = "\n".join(self._prompt_lines)
+        return self._prompt_history
+
+    def get_pending_question(self, target: str) -> str | None:
+        """
+        Get the question a participant has been asked but not answered yet.
+
+        Args:
+            target (str): The color of the participant who was asked.
+
+        Returns:
+            Optional[str]: The question text, or None if the participant has no question to answer.
         """
-        return self.conversation_history.copy()
+        return self._pending_questions.get(target)
 
     def is_game_finished(self) -> bool:
         """
@@ -333,13 +356,10 @@ class GameDynamics:
 
         guesses = {color: state.guess for color, state in self.participants.items() if state.guess is not None}
 
-        # Count correct guesses
-        correct_guesses = sum(1 for guess in guesses.values() if guess == self.human_color)
-
         return {
             "human_color": self.human_color,
             "guesses": guesses,
-            "correct_guesses": correct_guesses,
+            "correct_guesses": self._correct_guess_count,
             "total_participants": len(self.participants),
         }
 
@@ -351,10 +371,161 @@ class GameDynamics:
         self.current_turn = None
         self.phase = GamePhase.NOT_STARTED
         self.question_count = 0
+        self._asked_count = 0
+        self._guess_count = 0
+        self._correct_guess_count = 0
         self.conversation_history.clear()
+        self._asked_targets.clear()
+        self._pending_answerers.clear()
+        self._pending_questions.clear()
+        self._prompt_lines.clear()
+        self._invalidate_state()
 
         self.logger.info("Game reset to initial state")
 
+    def _transition(self, event: GameEvent) -> Callable:
+        """
+        Look up the handler for an event in the current phase.
+
+        Args:
+            event (GameEvent): The move being attempted.
+
+        Returns:
+            Callable: The unbound handler from _TRANSITIONS.
+
+        Raises:
+            ValueError: If the event is not allowed in the current phase.
+        """
+        handler = self._TRANSITIONS.get((self.phase, event))
+        if handler is None:
+            raise ValueError(f"Cannot {event.value} in phase: {self.phase.value}")
+        return handler
+
+    def _canonical(self, color: str) -> str:
+        """Return the interned participant key equal to color; other values pass through for validation to reject."""
+        return self._canonical_colors.get(color, color)
+
+    def _validate_participant(self, color: str, role: str):
+        """
+        Check that a color identifies a participant of this game.
+
+        Args:
+            color (str): The color to check.
+            role (str): The role of the color in the move, used in the error message (e.g., "asker").
+
+        Raises:
+            ValueError: If color is not a participant.
+        """
+        if color not in self.participants:
+            raise ValueError(f"Invalid {role}: {color}")
+
+    def _do_ask(self, asker: str, target: str, question: str):
+        """Validate and apply a question; only reachable in the asking phase."""
+        # Validate asker
+        self._validate_participant(asker, "asker")
+        if self.current_turn is not None and asker != self.current_turn:
+            raise ValueError(f"It's not Mr. {asker}'s turn (current turn: Mr. {self.current_turn})")
+        if self.participants[asker].has_asked:
+            raise ValueError(f"Mr. {asker} has already asked a question")
+
+        # Validate target
+        self._validate_participant(target, "target")
+        if asker == target:
+            raise ValueError("Cannot ask a question to yourself")
+
+        # Record the question
+        self.participants[asker].has_asked = True
+        self._asked_count += 1
+        self.question_count += 1
+        self.current_turn = target
+
+        # Add to conversation history
+        entry = {"asker": asker, "target": target, "question": question, "type": "question"}
+        self.conversation_history.append(entry)
+        self._asked_targets.add(target)
+        self._pending_answerers.append(target)
+        self._pending_questions[target] = question
+        self._prompt_lines.append(f"Mr. {asker} asked Mr. {target}: {question}")
+        self._invalidate_state()
+
+        self.logger.info("Mr. %s asked Mr. %s: %s", asker, target, question)
+        self.phase = GamePhase.ANSWERING_PHASE
+
+    def _do_answer(self, answerer: str, answer: str):
+        """Validate and apply an answer; only reachable in the answering phase."""
+        # Validate answerer
+        self._validate_participant(answerer, "answerer")
+        if self.current_turn != answerer:
+            raise ValueError(f"It's not Mr. {answerer}'s turn to answer (current turn: Mr. {self.current_turn})")
+        if self.participants[answerer].has_answered:
+            raise ValueError(f"Mr. {answerer} has already answered a question")
+
+        # Record the answer
+        self.participants[answerer].has_answered = True
+        if self._pending_answerers and self._pending_answerers[0] == answerer:
+            self._pending_answerers.popleft()
+        elif answerer in self._pending_answerers:
+            self._pending_answerers.remove(answerer)
+        self._pending_questions.pop(answerer, None)
+
+        # Add to conversation history
+        entry = {"answerer": answerer, "answer": answer, "type": "answer"}
+        self.conversation_history.append(entry)
+        self._prompt_lines.append(f"Mr. {answerer} answered: {answer}")
+        self._invalidate_state()
+
+        self.logger.info("Mr. %s answered: %s", answerer, answer)
+
+        # Update current_turn for next action
+        # If answerer hasn't asked yet, they should ask next (keep current_turn)
+        # Otherwise, find next person who needs to answer
+        if not self.participants[answerer].has_asked:
+            # Answerer will ask next, keep current_turn as is
+            pass
+        else:
+            # Find next person who has been asked a question but hasn't answered yet
+            self.current_turn = self._find_next_answerer()
+
+        # Check if question phase is complete
+        if self._is_q_and_a_phase_complete():
+            self._transition_to_guessing_phase()
+        else:
+            self.phase = GamePhase.ASKING_PHASE
+
+    def _do_guess(self, guesser: str, guess: str, reasoning: str):
+        """Validate and apply a guess; only reachable in the guessing phase."""
+        # Validate guesser
+        self._validate_participant(guesser, "guesser")
+        if self.participants[guesser].guess is not None:
+            raise ValueError(f"Mr. {guesser} has already made a guess")
+
+        # Validate guess
+        self._validate_participant(guess, "guess target")
+
+        # Record the guess
+        self.participants[guesser].guess = guess
+        self._guess_count += 1
+        if guess == self.human_color:
+            self._correct_guess_count += 1
+
+        # Add to conversation history
+        entry = {"guesser": guesser, "guess": guess, "reasoning": reasoning, "type": "guess"}
+        self.conversation_history.append(entry)
+        self._invalidate_state()
+
+        self.logger.info("Mr. %s guessed Mr. %s is the human. Reasoning: %s", guesser, guess, reasoning)
+
+        # Check if all guesses are complete
+        if self._are_all_guesses_complete():
+            self.phase = GamePhase.FINISHED
+
+    def _invalidate_state(self):
+        """Drop the cached game state and history snapshots after a mutation."""
+        self._cached_state = None
+        self._history_snapshot = None
+        self._prompt_history = None
+        self._targets_cache.clear()
+
     def _find_next_answerer(self) -> str | None:
         """
         Find the next participant who has been asked a question but hasn't answered yet.
@@ -362,13 +533,8 @@ class GameDynamics:
         Returns:
             Optional[str]: The color of the next participant who needs to answer, or None if everyone has answered.
         """
-        # Look through conversation history to find unanswered questions
-        for entry in self.conversation_history:
-            if entry["type"] == "question":
-                target = entry["target"]
-                if not self.participants[target].has_answered:
-                    return target
-        return None
+        # Questions are answered in the order they were asked, so the oldest pending target is next
+        return self._pending_answerers[0] if self._pending_answerers else None
 
     def _is_q_and_a_phase_complete(self) -> bool:
         """
@@ -386,7 +552,7 @@ class GameDynamics:
         Returns:
             bool: True if all guesses are complete, False otherwise.
         """
-        return all(state.guess is not None for state in self.participants.values())
+        return self._guess_count == len(self._participant_colors)
 
     def _transition_to_guessing_phase(self):
         """Transition the game to the guessing phase."""
@@ -399,7 +565,7 @@ class GameDynamics:
         self.phase = GamePhase.FINISHED
         self.logger.info("Game finished!")
 
-    def invoke_model(self, agent, chat_prompt: ChatPromptTemplate, **prompt_vars) -> str:
+    def invoke_model(self, agent, chat_prompt: ChatPromptTemplate | str, **prompt_vars) -> str:
         """
         Invoke a model agent with a formatted prompt and extract the response.
 
@@ -410,7 +576,7 @@ class GameDynamics:
 
         Args:
             agent: The LangChain agent to invoke (from Model.model)
-            chat_prompt: The ChatPromptTemplate to format
+            chat_prompt: The ChatPromptTemplate or template string (e.g., ANSWERING_TEMPLATE) to format
             **prompt_vars: Variables to format the prompt with
 
         Returns:
@@ -421,32 +587,128 @@ class GameDynamics:
         """
         try:
             # Format the prompt with the provided variables
-            formatted_prompt = chat_prompt.format(**prompt_vars)
+            formatted_prompt = self._format_prompt(chat_prompt, prompt_vars)
 
             # Invoke the agent with the formatted prompt
             response = agent.invoke({"messages": [{"role": "user", "content": formatted_prompt}]})
 
-            # Always extract the final message for frontend display
-            last_msg = None
-            if isinstance(response, dict) and "messages" in response:
-                messages = response["messages"]
-                if messages:
-                    last_msg_obj = messages[-1]
-                    # If it's a dict or an object with a 'content' attribute
-                    if isinstance(last_msg_obj, dict):
-                        last_msg = last_msg_obj.get("content", str(last_msg_obj))
-                    else:
-                        last_msg = getattr(last_msg_obj, "content", str(last_msg_obj))
-                if last_msg is None:
-                    last_msg = str(response)
-                return last_msg.strip()
-            # If response is a string, just return it
-            if isinstance(response, str):
-                return response.strip()
-            return str(response)
+            return self._extract_response(response)
         except Exception as e:
-            self.logger.error(f"Error invoking model: {e}")
+            self.logger.error("Error invoking model: %s", e)
             raise
 
+    async def ainvoke_model(self, agent, chat_prompt: ChatPromptTemplate | str, **prompt_vars) -> str:
+        """
+        Asynchronously invoke a model agent with a formatted prompt and extract the response.
+
+        Mirrors invoke_model but awaits the agent's async API, so several agents can be
+        prompted concurrently (e.g., all AI participants during the guessing phase).
+
+        Args:
+            agent: The LangChain agent to invoke (from Model.model)
+            chat_prompt: The ChatPromptTemplate or template string (e.g., ANSWERING_TEMPLATE) to format
+            **prompt_vars: Variables to format the prompt with
+
+        Returns:
+            str: The extracted response message content
+
+        Raises:
+            Exception: If invocation fails
+        """
+        try:
+            formatted_prompt = self._format_prompt(chat_prompt, prompt_vars)
+            response = await agent.ainvoke({"messages": [{"role": "user", "content": formatted_prompt}]})
+            return self._extract_response(response)
+        except Exception as e:
+            self.logger.error("Error invoking model: %s", e)
+            raise
+
+    def stream_model(self, agent, chat_prompt: ChatPromptTemplate | str, **prompt_vars) -> Iterator[str]:
+        """
+        Invoke a model agent with a formatted prompt and yield the response as it is generated.
+
+        Only the model's own message chunks are yielded; callers join them (and strip the
+        result) once the stream is exhausted to obtain the same text invoke_model returns.
+
+        Args:
+            agent: The LangChain agent to invoke (from Model.model)
+            chat_prompt: The ChatPromptTemplate or template string (e.g., ANSWERING_TEMPLATE) to format
+            **prompt_vars: Variables to format the prompt with
+
+        Yields:
+            str: Successive pieces of the response message content
+
+        Raises:
+            Exception: If invocation fails
+        """
+        try:
+            formatted_prompt = self._format_prompt(chat_prompt, prompt_vars)
+            stream = agent.stream(
+                {"messages": [{"role": "user", "content": formatted_prompt}]},
+                stream_mode="messages",
+            )
+            for chunk, _metadata in stream:
+                if getattr(chunk, "type", None) not in _AI_MESSAGE_TYPES:
+                    continue
+                content = getattr(chunk, "content", None)
+                if isinstance(content, str) and content:
+                    yield content
+        except Exception as e:
+            self.logger.error("Error invoking model: %s", e)
+            raise
+
+    async def ainvoke_models(self, agents: list, chat_prompt: ChatPromptTemplate | str, **prompt_vars) -> list[str]:
+        """
+        Invoke several model agents concurrently with the same prompt.
+
+        Args:
+            agents (list): The LangChain agents to invoke (from Model.model)
+            chat_prompt: The ChatPromptTemplate or template string (e.g., ANSWERING_TEMPLATE) to format
+            **prompt_vars: Variables to format the prompt with
+
+        Returns:
+            list[str]: The extracted responses, in the same order as agents
+        """
+        return list(await asyncio.gather(*(self.ainvoke_model(agent, chat_prompt, **prompt_vars) for agent in agents)))
+
+    @staticmethod
+    def _format_prompt(chat_prompt: ChatPromptTemplate | str, prompt_vars: dict) -> str:
+        """
+        Format a prompt, using plain string formatting for pre-validated template strings.
+
+        Args:
+            chat_prompt: The ChatPromptTemplate or template string to format
+            prompt_vars (dict): Variables to format the prompt with
+
+        Returns:
+            str: The formatted prompt
+        """
+        if isinstance(chat_prompt, str):
+            return format_fast(chat_prompt, **prompt_vars)
+        return chat_prompt.format(**prompt_vars)
+
+    @staticmethod
+    def _extract_response(response) -> str:
+        """
+        Extract the final message content from an agent response.
+
+        Args:
+            response: The raw response returned by the agent
+
+        Returns:
+            str: The extracted response message content
+        """
+        extractor = _EXTRACTORS.get(type(response))
+        if extractor is None:
+            extractor = _EXTRACTORS[type(response)] = _make_extractor(response)
+        return extractor(response)
+
     def __str__(self):
         return f"GameDynamics(phase={self.phase}, current_turn={self.current_turn}, participants={self.participants})"
+
+    # Game state machine: each move is only valid in one phase, anything missing here is rejected
+    _TRANSITIONS: dict[tuple[GamePhase, GameEvent], Callable] = {
+        (GamePhase.ASKING_PHASE, GameEvent.ASK): _do_ask,
+        (GamePhase.ANSWERING_PHASE, GameEvent.ANSWER): _do_answer,
+        (GamePhase.GUESSING_PHASE, GameEvent.GUESS): _do_guess,
+    }
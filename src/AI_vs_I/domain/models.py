@@ -1,38 +1,129 @@
+import json
+from functools import cache
+
 from langchain.agents import create_agent
+from langchain_core.messages import AIMessageChunk
 from langchain_groq import ChatGroq
 
-from AI_vs_I.domain.memory.short_term_memory import ShortTermMemory
-from AI_vs_I.domain.prompts.prompt_templates import system_prompt
+from AI_vs_I.domain.prompts.prompt_templates import get_system_prompt
 from AI_vs_I.infrastructure.monitoring.logger import Logger
+from AI_vs_I.infrastructure.response_cache import is_cache_enabled, load_response, response_key, store_response
 
 logger = Logger.get_logger("model")
 
 
+@cache
+def _get_llm(model_name: str) -> ChatGroq:
+    """
+    Build the chat model for a model name, shared by every agent using it so they share its connection pools.
+
+    Args:
+        model_name (str): The model name to use for the LLM.
+
+    Returns:
+        ChatGroq: The initialized chat model.
+    """
+    return ChatGroq(model=model_name, temperature=0.3, max_retries=2)
+
+
+@cache
+def _get_agent(model_name: str, color: str):
+    """
+    Build the agent for a model/color pair, reusing it across Model instances and game resets.
+
+    Args:
+        model_name (str): The model name to use for the LLM.
+        color (str): The color assigned to the LLM.
+
+    Returns:
+        model: The initialized agent.
+    """
+    return create_agent(
+        model=_get_llm(model_name),
+        tools=[],
+        system_prompt=get_system_prompt(color),
+    )
+
+
+class _CachedAgent:
+    """
+    Agent wrapper that replays responses from the on-disk cache (enabled with AI_VS_I_CACHE=1).
+
+    Cache hits are returned in the agent response shape ({"messages": [...]}), so callers
+    extract them exactly like live responses. Any other attribute is delegated to the agent.
+    """
+
+    def __init__(self, agent, model_key: str):
+        self._agent = agent
+        self._model_key = model_key
+
+    def __getattr__(self, name):
+        return getattr(self._agent, name)
+
+    def invoke(self, inputs: dict, *args, **kwargs):
+        key = self._key(inputs)
+        cached = load_response(key)
+        if cached is not None:
+            return {"messages": [{"role": "assistant", "content": cached}]}
+        response = self._agent.invoke(inputs, *args, **kwargs)
+        self._store(key, response)
+        return response
+
+    async def ainvoke(self, inputs: dict, *args, **kwargs):
+        key = self._key(inputs)
+        cached = load_response(key)
+        if cached is not None:
+            return {"messages": [{"role": "assistant", "content": cached}]}
+        response = await self._agent.ainvoke(inputs, *args, **kwargs)
+        self._store(key, response)
+        return response
+
+    def stream(self, inputs: dict, *args, **kwargs):
+        # Only token streams (stream_mode="messages") are cached
+        if kwargs.get("stream_mode") != "messages":
+            yield from self._agent.stream(inputs, *args, **kwargs)
+            return
+        key = self._key(inputs)
+        cached = load_response(key)
+        if cached is not None:
+            # Replay the whole cached response as a single chunk
+            yield AIMessageChunk(content=cached), {}
+            return
+        parts = []
+        for chunk, metadata in self._agent.stream(inputs, *args, **kwargs):
+            if isinstance(chunk, AIMessageChunk) and isinstance(chunk.content, str):
+                parts.append(chunk.content)
+            yield chunk, metadata
+        if parts:
+            store_response(key, "".join(parts))
+
+    def _key(self, inputs: dict) -> str:
+        return response_key(self._model_key, json.dumps(inputs, sort_keys=True, default=str))
+
+    @staticmethod
+    def _store(key: str, response):
+        # Only plain-text final messages are cached; anything else is passed through uncached
+        messages = response.get("messages") if isinstance(response, dict) else None
+        content = getattr(messages[-1], "content", None) if messages else None
+        if isinstance(content, str):
+            store_response(key, content)
+
+
 class Model:
     name: str
     color: str
     model: ChatGroq
-    _contexts: dict[str, ShortTermMemory]
+    llm: ChatGroq
     logger: Logger
 
     def __init__(self, color: str, model_name: str):
         self.model_name = model_name
         self.color = color
         self.model = self.start_model(color, model_name)
-        self._contexts = {}
+        # The underlying chat model, e.g. for warming its connections before the first turn
+        self.llm = _get_llm(model_name)
         self.logger = Logger.get_logger(f"model {model_name}")
-        self.logger.info(f"Model {model_name} (Mr. {color}) initialized.")
-
-    def get_context(self) -> ShortTermMemory:
-        """
-        Retrieve or create a ShortTermMemory for this model/color.
-
-        Returns:
-            ShortTermMemory: The conversation context.
-        """
-        if self.color not in self._contexts:
-            self._contexts[self.color] = ShortTermMemory(model_name=self.model_name)
-        return self._contexts[self.color]
+        self.logger.info("Model %s (Mr. %s) initialized.", model_name, color)
 
     def start_model(self, color, model="llama-3.1-8b-instant"):
         """
@@ -49,14 +140,16 @@ class Model:
             Exception: For unexpected errors during initialization.
         """
         try:
-            llm_model = ChatGroq(model=model, temperature=0.3, max_retries=2)
-
-            agent = create_agent(
-                model=llm_model,
-                tools=[],
-                system_prompt=system_prompt.format(agent_color=color),
-            )
+            agent = _get_agent(model, color)
+            if is_cache_enabled():
+                return _CachedAgent(agent, f"{model}:{color}")
             return agent
         except Exception as e:
-            logger.exception(f"Error initializing agent: {e}")
+            logger.exception("Error initializing agent: %s", e)
             raise Exception(f"Error initializing agent: {e}") from e
+
+    @staticmethod
+    def invalidate():
+        """Drop all cached agents and chat models so the next Model instantiation builds fresh ones."""
+        _get_agent.cache_clear()
+        _get_llm.cache_clear()
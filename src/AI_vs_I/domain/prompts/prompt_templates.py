@@ -1,3 +1,7 @@
+import re
+from functools import cache
+from string import Formatter
+
 from langchain_core.prompts import PromptTemplate
 
 # System prompt template for all the LLMs.
@@ -25,6 +29,21 @@ system_prompt = PromptTemplate(
     input_variables=["agent_color"],
 )
 
+
+@cache
+def get_system_prompt(agent_color: str) -> str:
+    """
+    Format the system prompt for a participant color, once per color.
+
+    Args:
+        agent_color (str): The color assigned to the LLM.
+
+    Returns:
+        str: The formatted system prompt.
+    """
+    return system_prompt.format(agent_color=agent_color)
+
+
 answering_prompt = PromptTemplate(
     template=("Previous conversation:\n{conversation_history}\n\nQuestion to answer:\n{question}\n\n"),
     input_variables=["conversation_history", "question"],
@@ -63,3 +82,46 @@ guessing_prompt = PromptTemplate(
     ),
     input_variables=["conversation_history"],
 )
+
+# Matches the answer format requested by guessing_prompt; group 1 is the guessed color.
+GUESS_PATTERN = re.compile(r"I think Mr\.\s+(\w+)\s+is the human", re.IGNORECASE)
+
+
+def _template_string(prompt: PromptTemplate) -> str:
+    """
+    Return the raw template string of a prompt after checking its placeholders once.
+
+    Args:
+        prompt (PromptTemplate): The prompt whose template is extracted.
+
+    Returns:
+        str: The template string, ready for format_fast.
+
+    Raises:
+        ValueError: If the template placeholders do not match the declared input variables.
+    """
+    fields = {name for _, name, _, _ in Formatter().parse(prompt.template) if name}
+    if fields != set(prompt.input_variables):
+        raise ValueError(f"Template variables {sorted(fields)} do not match {sorted(prompt.input_variables)}")
+    return prompt.template
+
+
+# Raw template strings for the per-turn prompts, formatted with format_fast on the hot path.
+ANSWERING_TEMPLATE = _template_string(answering_prompt)
+FIRST_ASKING_TEMPLATE = _template_string(first_asking_prompt)
+ASKING_TEMPLATE = _template_string(asking_prompt)
+GUESSING_TEMPLATE = _template_string(guessing_prompt)
+
+
+def format_fast(template: str, **prompt_vars) -> str:
+    """
+    Format a template string validated at import, skipping PromptTemplate's per-call overhead.
+
+    Args:
+        template (str): One of the *_TEMPLATE strings.
+        **prompt_vars: Variables to format the template with. Unused variables are ignored.
+
+    Returns:
+        str: The formatted prompt.
+    """
+    return template.format_map(prompt_vars)
@@ -0,0 +1,64 @@
+import os
+from hashlib import blake2b
+from pathlib import Path
+
+from AI_vs_I.infrastructure.monitoring.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# The cache is opt-in so production games always hit the model
+CACHE_ENV_VAR = "AI_VS_I_CACHE"
+CACHE_DIR = Path(".cache/ai_vs_i")
+
+
+def is_cache_enabled() -> bool:
+    """
+    Check whether the on-disk response cache is enabled.
+
+    Returns:
+        bool: True if the AI_VS_I_CACHE environment variable is set to "1".
+    """
+    return os.environ.get(CACHE_ENV_VAR) == "1"
+
+
+def response_key(model_key: str, prompt: str) -> str:
+    """
+    Build the cache key for a model response.
+
+    Args:
+        model_key (str): Identifies the model and its system prompt (e.g., "llama-3.1-8b-instant:Red").
+        prompt (str): The full prompt sent to the model.
+
+    Returns:
+        str: Hex digest identifying the (model, prompt) pair.
+    """
+    return blake2b(f"{model_key}\n{prompt}".encode(), digest_size=16).hexdigest()
+
+
+def load_response(key: str) -> str | None:
+    """
+    Load a cached response.
+
+    Args:
+        key (str): The key returned by response_key.
+
+    Returns:
+        Optional[str]: The cached response, or None on a cache miss.
+    """
+    path = CACHE_DIR / f"{key}.txt"
+    if not path.is_file():
+        return None
+    logger.info("Response cache hit: %s", key)
+    return path.read_text(encoding="utf-8")
+
+
+def store_response(key: str, response: str):
+    """
+    Store a response in the cache.
+
+    Args:
+        key (str): The key returned by response_key.
+        response (str): The response content to store.
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    (CACHE_DIR / f"{key}.txt").write_text(response, encoding="utf-8")
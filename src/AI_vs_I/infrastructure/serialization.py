@@ -0,0 +1,24 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library encoder
+    orjson = None
+
+
+def dumps(obj) -> bytes:
+    """
+    Serialize game state or conversation history to UTF-8 encoded JSON.
+
+    Uses orjson when it is installed and the standard json module otherwise; both
+    produce compact output so the result does not depend on which encoder ran.
+
+    Args:
+        obj: The object to serialize (e.g., the result of GameDynamics.get_game_state()).
+
+    Returns:
+        bytes: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
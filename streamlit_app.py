@@ -1,31 +1,40 @@
 """
-Streamlit app for AI vs I reverse Turing test game with WhatsApp-like UI.
+Streamlit app for AI vs I reverse Turing test game with a chat UI.
 
 This app provides a chat interface where a human player (Mr. Orange) interacts
 with AI participants in a reverse Turing test game.
 """
 
+import asyncio
+import html
+import os
 import random
-import re
+import threading
+from collections import Counter
 from datetime import datetime
 
 import streamlit as st
 from dotenv import load_dotenv
 
 from src.AI_vs_I.application.dictionaries import (
+    AI_COLORS,
     AVAILABLE_GROQ_MODELS,
+    AVAILABLE_GROQ_MODELS_INDEX,
     COLOR_EMOJIS,
     HUMAN_COLOR,
     PARTICIPANT_COLORS,
+    PARTICIPANT_COLORS_SET,
 )
 from src.AI_vs_I.application.game_dynamics import GameDynamics, GamePhase
 from src.AI_vs_I.domain.models import Model
 from src.AI_vs_I.domain.prompts.prompt_templates import (
-    answering_prompt,
-    asking_prompt,
-    first_asking_prompt,
-    guessing_prompt,
+    ANSWERING_TEMPLATE,
+    ASKING_TEMPLATE,
+    FIRST_ASKING_TEMPLATE,
+    GUESS_PATTERN,
+    GUESSING_TEMPLATE,
 )
+from src.AI_vs_I.infrastructure.response_cache import is_cache_enabled
 
 # Load environment variables
 load_dotenv()
@@ -39,9 +48,18 @@ st.set_page_config(
 )
 
 
-# Load external CSS for WhatsApp-like UI
-with open("static/style.css") as f:
-    st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+CSS_PATH = "static/style.css"
+
+
+@st.cache_data
+def _css_tag(mtime: float) -> str:
+    """Read the stylesheet into a <style> tag; the modification time keys the cache so edits are picked up."""
+    with open(CSS_PATH) as f:
+        return f"<style>{f.read()}</style>"
+
+
+# Load external CSS
+st.markdown(_css_tag(os.path.getmtime(CSS_PATH)), unsafe_allow_html=True)
 
 
 def initialize_game():
@@ -57,34 +75,77 @@ def initialize_game():
         st.session_state.selected_target = None
         st.session_state.guessing_phase_announced = False
         st.session_state.answer_order = []  # Track the order participants answered
+        # Source of the session's random picks, kept across reruns; set AI_VS_I_SEED to reproduce
+        # the targets and starting players of a session
+        st.session_state.rng = random.Random(os.environ.get("AI_VS_I_SEED"))
+        st.session_state.ai_guesses = {}  # AI guess responses fetched but not yet recorded
+        st.session_state.unreachable_models = {}  # Model name -> error from the last warm-up
 
         # Initialize model selections with default model for each AI color
         if "model_selections" not in st.session_state:
-            st.session_state.model_selections = {
-                color: "llama-3.1-8b-instant" for color in PARTICIPANT_COLORS if color != HUMAN_COLOR
-            }
+            st.session_state.model_selections = {color: "llama-3.1-8b-instant" for color in AI_COLORS}
+
+
+@st.cache_resource
+def build_model(color: str, model_name: str) -> Model:
+    """Build a Model once per color/model pair and share it across sessions and reruns."""
+    return Model(color=color, model_name=model_name)
 
 
 def initialize_ai_models():
     """Initialize AI models for non-human participants."""
     if not st.session_state.ai_models:
         with st.spinner("Initializing AI participants..."):
-            for color in PARTICIPANT_COLORS:
-                if color != HUMAN_COLOR:
-                    # Use the selected model for each color
-                    model_name = st.session_state.model_selections.get(color, "llama-3.1-8b-instant")
-                    st.session_state.ai_models[color] = Model(color=color, model_name=model_name)
+            for color in AI_COLORS:
+                # Use the selected model for each color
+                model_name = st.session_state.model_selections.get(color, "llama-3.1-8b-instant")
+                st.session_state.ai_models[color] = build_model(color, model_name)
+
+
+async def _ping(llm):
+    """Send a one-token request through both the sync and async clients of a chat model."""
+    llm = llm.bind(max_tokens=1)
+    await asyncio.gather(llm.ainvoke("ping"), asyncio.to_thread(llm.invoke, "ping"))
+
+
+@st.cache_resource
+def _warmed_models() -> set[str]:
+    """Names of the models whose shared clients have already been warmed in this server process."""
+    return set()
+
+
+def warm_up_models(ai_models):
+    """
+    Open the connections to every selected model concurrently so the first turn does not pay for them.
+
+    Each shared model is warmed once per process, and not at all when responses come from the on-disk
+    cache. Models that cannot be reached are kept in st.session_state.unreachable_models, shown by main(),
+    and retried at the next game start.
+    """
+    st.session_state.unreachable_models = {}
+    if is_cache_enabled():
+        return
+
+    warmed = _warmed_models()
+    llms = {ai_model.model_name: ai_model.llm for ai_model in ai_models if ai_model.model_name not in warmed}
+    if not llms:
+        return
+
+    async def ping_all():
+        return await asyncio.gather(*(_ping(llm) for llm in llms.values()), return_exceptions=True)
+
+    with st.spinner("Connecting to AI models..."):
+        results = run_async(ping_all())
+    for model_name, result in zip(llms, results, strict=True):
+        if isinstance(result, Exception):
+            st.session_state.unreachable_models[model_name] = str(result)
+        else:
+            warmed.add(model_name)
 
 
 def format_conversation_history():
     """Format conversation history for AI models."""
-    history = []
-    for entry in st.session_state.game.get_conversation_history():
-        if entry["type"] == "question":
-            history.append(f"Mr. {entry['asker']} asked Mr. {entry['target']}: {entry['question']}")
-        elif entry["type"] == "answer":
-            history.append(f"Mr. {entry['answerer']} answered: {entry['answer']}")
-    return "\n".join(history) if history else "No previous conversation."
+    return st.session_state.game.get_prompt_history() or "No previous conversation."
 
 
 def add_chat_message(sender: str, content: str, msg_type: str = "message"):
@@ -95,79 +156,93 @@ def add_chat_message(sender: str, content: str, msg_type: str = "message"):
         "type": msg_type,
         "timestamp": datetime.now().strftime("%H:%M"),
     }
+    if msg_type == "system":
+        # Escaped once here, since the phase indicator is rendered with unsafe_allow_html
+        message["content_html"] = html.escape(content)
     st.session_state.messages.append(message)
 
 
+def render_chat_message(sender: str, content: str, timestamp: str) -> str:
+    """Render a single chat message as markdown: a sender and time header above the content."""
+    return f"**Mr. {sender}** · {timestamp}\n\n{content}"
+
+
+@st.fragment
 def display_chat_messages():
-    """Display all chat messages in WhatsApp-like format."""
-    chat_container = st.container()
-    with chat_container:
-        # Start scrollable container
-        messages_html = '<div id="chat-container" style="max-height: 40vh; overflow-y: auto; padding-right: 8px;">'
-
-        for msg in st.session_state.messages:
-            if msg["type"] == "system":
-                messages_html += f'<div class="phase-indicator">{msg["content"]}</div>'
-            else:
-                is_human = msg["sender"] == HUMAN_COLOR
-                message_class = "human-message" if is_human else "ai-message"
-                emoji = COLOR_EMOJIS.get(msg["sender"], "💬")
-
-                messages_html += (
-                    f'<div class="chat-message {message_class}">'
-                    f'<div class="message-header">{emoji} Mr. {msg["sender"]}</div>'
-                    f"<div>{msg['content']}</div>"
-                    f'<div class="message-time">{msg["timestamp"]}</div>'
-                    "</div>"
-                )
+    """Display all chat messages, one chat element per message."""
+    # One element per message lets Streamlit diff the chat instead of resending it whole
+    for msg in st.session_state.messages:
+        if msg["type"] == "system":
+            st.markdown(f'<div class="phase-indicator">{msg["content_html"]}</div>', unsafe_allow_html=True)
+            continue
+
+        role = "user" if msg["sender"] == HUMAN_COLOR else "assistant"
+        with st.chat_message(role, avatar=COLOR_EMOJIS.get(msg["sender"], "💬")):
+            st.markdown(render_chat_message(msg["sender"], msg["content"], msg["timestamp"]))
+
+
+@st.cache_resource
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Start the background event loop that runs all async model calls for the lifetime of the server."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="ai-vs-i-event-loop", daemon=True).start()
+    return loop
 
-        # Close scrollable container
-        messages_html += "</div>"
-        st.markdown(messages_html, unsafe_allow_html=True)
 
+def run_async(coro):
+    """Run a coroutine to completion from the Streamlit script thread and return its result."""
+    # A single long-lived loop keeps the async clients' pooled connections usable across calls;
+    # asyncio.run would tie them to a fresh loop that is closed as soon as the call returns
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop()).result()
 
-def handle_ai_answer_turn():
-    """Handle AI participant answering a question."""
+
+def stream_ai_response(color: str, chat_prompt: str, **prompt_vars) -> str:
+    """Stream an AI participant's response into the page as it is generated and return the full text."""
+    game = st.session_state.game
+    ai_model = st.session_state.ai_models[color]
+    with st.chat_message("assistant", avatar=COLOR_EMOJIS[color]):
+        response = st.write_stream(game.stream_model(ai_model.model, chat_prompt, **prompt_vars))
+    return response.strip()
+
+
+def handle_ai_answer_turn() -> bool:
+    """Handle AI participant answering a question; return True if an answer was recorded and the caller should rerun."""
     game = st.session_state.game
     if game.phase != GamePhase.ANSWERING_PHASE:
-        return
+        return False
 
+    # Every question is answered before the next one is asked, so at most one question is pending
+    # and answers cannot be batched like guesses: each answer feeds the history of the next question.
     # Find the question that was asked to the current participant
-    has_pending_question = False
-    last_question = None
-    for entry in reversed(game.conversation_history):
-        if entry["type"] == "question" and entry["target"] == game.current_turn:
-            last_question = entry["question"]
-            has_pending_question = True
-            break
+    last_question = game.get_pending_question(game.current_turn)
+    has_pending_question = last_question is not None
 
     current_turn = game.current_turn
     participant = game.participants[current_turn]
 
     # If there's a pending question and this participant hasn't answered yet
     if has_pending_question and not participant.has_answered:
-        ai_model = st.session_state.ai_models[current_turn]
         conv_history = format_conversation_history()
-        with st.spinner(f"Mr. {current_turn} is answering..."):
-            answer = game.invoke_model(
-                ai_model.model,
-                answering_prompt,
-                conversation_history=conv_history,
-                question=last_question,
-            )
+        answer = stream_ai_response(
+            current_turn,
+            ANSWERING_TEMPLATE,
+            conversation_history=conv_history,
+            question=last_question,
+        )
         game.record_answer(current_turn, answer)
         add_chat_message(current_turn, answer, "answer")
         # Track answer order for guessing phase
         if current_turn not in st.session_state.answer_order:
             st.session_state.answer_order.append(current_turn)
-        st.rerun()
+        return True
+    return False
 
 
-def handle_ai_asking_turn():
-    """Handle AI participant asking a question."""
+def handle_ai_asking_turn() -> bool:
+    """Handle AI participant asking a question; return True if a question was recorded and the caller should rerun."""
     game = st.session_state.game
     if game.phase != GamePhase.ASKING_PHASE:
-        return
+        return False
 
     # Check if it's an AI's turn to ask
     if game.current_turn and game.current_turn != HUMAN_COLOR:
@@ -178,26 +253,116 @@ def handle_ai_asking_turn():
         if not participant.has_asked:
             available_targets = game.get_available_targets(current_turn)
             if available_targets:
-                target = random.choice(available_targets)
-                ai_model = st.session_state.ai_models[current_turn]
-                conv_history = format_conversation_history()
-                with st.spinner(f"Mr. {current_turn} is asking..."):
-                    if game.question_count == 0:
-                        question = game.invoke_model(
-                            ai_model.model,
-                            first_asking_prompt,
-                            target_model=f"Mr. {target}",
-                        )
-                    else:
-                        question = game.invoke_model(
-                            ai_model.model,
-                            asking_prompt,
-                            conversation_history=conv_history,
-                            target_model=f"Mr. {target}",
-                        )
+                target = st.session_state.rng.choice(available_targets)
+                # The opening question has no history to build on
+                if game.question_count == 0:
+                    question = stream_ai_response(
+                        current_turn,
+                        FIRST_ASKING_TEMPLATE,
+                        target_model=f"Mr. {target}",
+                    )
+                else:
+                    question = stream_ai_response(
+                        current_turn,
+                        ASKING_TEMPLATE,
+                        conversation_history=format_conversation_history(),
+                        target_model=f"Mr. {target}",
+                    )
                 game.record_question(current_turn, target, question)
                 add_chat_message(current_turn, question, "question")
-                st.rerun()
+                return True
+    return False
+
+
+def fetch_ai_guesses():
+    """Ask every AI participant that still has to guess for its guess, concurrently."""
+    game = st.session_state.game
+    pending = [
+        color
+        for color in st.session_state.answer_order
+        if color != HUMAN_COLOR and game.participants[color].guess is None and color not in st.session_state.ai_guesses
+    ]
+    if not pending:
+        return
+
+    # Guesses only depend on the questions and answers, so they can all be requested at once
+    conv_history = format_conversation_history()
+    with st.spinner("AI participants are guessing..."):
+        responses = run_async(
+            game.ainvoke_models(
+                [st.session_state.ai_models[color].model for color in pending],
+                GUESSING_TEMPLATE,
+                conversation_history=conv_history,
+                target_model="",
+            )
+        )
+    st.session_state.ai_guesses.update(zip(pending, responses, strict=True))
+
+
+def record_ai_guess(color: str, response: str):
+    """Extract an AI participant's guess from its response and record it."""
+    game = st.session_state.game
+    # Extract the color from the response using regex
+    # Expected format: "I think Mr. [Color] is the human because..."
+    guess = color  # Default to self if extraction fails
+    match = GUESS_PATTERN.search(response)
+    if match:
+        extracted_color = match.group(1)
+        # Validate that the extracted color is a valid participant
+        if extracted_color in PARTICIPANT_COLORS_SET:
+            guess = extracted_color
+    reasoning = response
+    game.record_guess(color, guess, reasoning)
+    add_chat_message(color, f"I think Mr. {guess} is the human. {reasoning}", "guess")
+
+
+@st.fragment
+def guessing_panel():
+    """
+    Collect guesses in answer order; everyone guesses who is human.
+
+    As a fragment, the human's guess widgets rerun only this panel. Recording guesses triggers a
+    full rerun so the chat, the sidebar and, after the last guess, the results are refreshed.
+    """
+    game = st.session_state.game
+    answer_order = st.session_state.answer_order
+
+    # Participants guess in the same order they answered questions,
+    # which maintains consistency with the question/answer flow
+    next_to_guess = next((color for color in answer_order if game.participants[color].guess is None), None)
+    if next_to_guess is None:
+        return
+
+    if next_to_guess == HUMAN_COLOR:
+        # Human's turn to guess
+        st.divider()
+        st.subheader("Guessing Phase - Your Turn")
+        st.write("Who do you think is the human?")
+
+        guess = st.selectbox(
+            "Select your guess:",
+            AI_COLORS,
+            format_func=lambda x: f"{COLOR_EMOJIS[x]} Mr. {x}",
+        )
+
+        reasoning = st.text_area("Explain your reasoning:", placeholder="I think it's Mr. X because...")
+
+        if st.button("Submit Guess", use_container_width=True):
+            if reasoning.strip():
+                handle_human_guess(guess, reasoning)
+            else:
+                st.warning("Please provide reasoning for your guess.")
+    else:
+        # AI's turn to guess: fetch all pending AI guesses in one batch, then
+        # record them in answer order up to the human's turn
+        fetch_ai_guesses()
+        for color in answer_order:
+            if game.participants[color].guess is not None:
+                continue
+            if color == HUMAN_COLOR:
+                break
+            record_ai_guess(color, st.session_state.ai_guesses.pop(color))
+        st.rerun()
 
 
 def start_game():
@@ -210,12 +375,14 @@ def start_game():
         st.session_state.messages = []
         st.session_state.guessing_phase_announced = False
         st.session_state.answer_order = []
+        st.session_state.ai_guesses = {}
 
     # Initialize AI models
     initialize_ai_models()
+    warm_up_models(st.session_state.ai_models.values())
 
     # Start the game with a random participant
-    starting_participant = random.choice(PARTICIPANT_COLORS)
+    starting_participant = st.session_state.rng.choice(PARTICIPANT_COLORS)
     game.start_game(starting_participant)
 
     st.session_state.game_started = True
@@ -225,10 +392,8 @@ def start_game():
         "system",
     )
 
-    # If starting participant is AI, trigger their turn
-    if starting_participant != HUMAN_COLOR:
-        handle_ai_asking_turn()
-    else:
+    # An AI starter asks from main() after the rerun, so its question streams into the chat, not the sidebar
+    if starting_participant == HUMAN_COLOR:
         st.session_state.waiting_for_human_input = True
         st.session_state.human_input_type = "question"
 
@@ -283,6 +448,10 @@ def main():
     # Initialize game
     initialize_game()
 
+    # Reported here because start_game is followed by a rerun, which would clear a warning drawn there
+    for model_name, error in st.session_state.unreachable_models.items():
+        st.warning(f"Could not reach {model_name}: {error}")
+
     # Sidebar
     with st.sidebar:
         st.header("Game Controls")
@@ -292,16 +461,15 @@ def main():
             st.write("Choose a model for each AI player:")
 
             # Add model selection dropdown for each AI color
-            for color in PARTICIPANT_COLORS:
-                if color != HUMAN_COLOR:
-                    emoji = COLOR_EMOJIS[color]
-                    selected_model = st.selectbox(
-                        f"{emoji} Mr. {color}",
-                        options=AVAILABLE_GROQ_MODELS,
-                        index=AVAILABLE_GROQ_MODELS.index(st.session_state.model_selections[color]),
-                        key=f"model_select_{color}",
-                    )
-                    st.session_state.model_selections[color] = selected_model
+            for color in AI_COLORS:
+                emoji = COLOR_EMOJIS[color]
+                selected_model = st.selectbox(
+                    f"{emoji} Mr. {color}",
+                    options=AVAILABLE_GROQ_MODELS,
+                    index=AVAILABLE_GROQ_MODELS_INDEX[st.session_state.model_selections[color]],
+                    key=f"model_select_{color}",
+                )
+                st.session_state.model_selections[color] = selected_model
 
             st.divider()
 
@@ -316,6 +484,8 @@ def main():
                 st.session_state.waiting_for_human_input = False
                 st.session_state.guessing_phase_announced = False
                 st.session_state.answer_order = []
+                st.session_state.ai_guesses = {}
+                st.session_state.unreachable_models = {}
                 st.rerun()
 
         st.divider()
@@ -329,6 +499,9 @@ def main():
 
             st.divider()
             st.subheader("Participants")
+            # Build the whole list as one markdown block: one element per rerun instead of up to three per participant
+            show_progress = game.phase == GamePhase.ASKING_PHASE or game.phase == GamePhase.ANSWERING_PHASE
+            lines = []
             for color in PARTICIPANT_COLORS:
                 participant = game.participants[color]
                 emoji = COLOR_EMOJIS[color]
@@ -337,10 +510,11 @@ def main():
                 else:
                     model_name = st.session_state.model_selections[color]
                     status = f"🤖 ({model_name})"
-                st.write(f"{emoji} Mr. {color} {status}")
-                if game.phase == GamePhase.ASKING_PHASE or game.phase == GamePhase.ANSWERING_PHASE:
-                    st.write(f"  - Asked: {'✅' if participant.has_asked else '❌'}")
-                    st.write(f"  - Answered: {'✅' if participant.has_answered else '❌'}")
+                lines.append(f"- {emoji} Mr. {color} {status}")
+                if show_progress:
+                    lines.append(f"    - Asked: {'✅' if participant.has_asked else '❌'}")
+                    lines.append(f"    - Answered: {'✅' if participant.has_answered else '❌'}")
+            st.markdown("\n".join(lines))
 
     # Main chat area and input controls grouped together
     if not st.session_state.game_started:
@@ -353,19 +527,30 @@ def main():
     else:
         game = st.session_state.game
 
-        if game.current_turn and game.current_turn != HUMAN_COLOR:
-            if game.phase == GamePhase.ASKING_PHASE:
-                # AI's turn to ask a question
-                handle_ai_asking_turn()
-                st.rerun()
-            elif game.phase == GamePhase.ANSWERING_PHASE:
-                # AI's turn to answer a question
-                handle_ai_answer_turn()
-                st.rerun()
+        # Add system message when first entering guessing phase, before the chat is drawn
+        if game.phase == GamePhase.GUESSING_PHASE and not st.session_state.guessing_phase_announced:
+            add_chat_message(
+                "System",
+                "🎯 Question phase complete! Now it's time to guess who the human is.",
+                "system",
+            )
+            st.session_state.guessing_phase_announced = True
 
         # Group chat and input controls in one container
         with st.container():
-            display_chat_messages()
+            with st.container(height=400, border=False):
+                display_chat_messages()
+
+                # An AI's response streams in below the history, inside the same scrolling chat box
+                if game.current_turn and game.current_turn != HUMAN_COLOR:
+                    if game.phase == GamePhase.ASKING_PHASE:
+                        # AI's turn to ask a question
+                        if handle_ai_asking_turn():
+                            st.rerun()
+                    elif game.phase == GamePhase.ANSWERING_PHASE:
+                        # AI's turn to answer a question
+                        if handle_ai_answer_turn():
+                            st.rerun()
 
             # Check if it's human's turn
             is_human_turn = game.current_turn == HUMAN_COLOR
@@ -400,10 +585,9 @@ def main():
                 elif not participant.has_answered and game.phase == GamePhase.ANSWERING_PHASE:
                     # Human needs to answer a question
                     # Find the question asked to human
-                    for entry in reversed(game.conversation_history):
-                        if entry["type"] == "question" and entry["target"] == HUMAN_COLOR:
-                            st.session_state.current_question = entry["question"]
-                            break
+                    last_question = game.get_pending_question(HUMAN_COLOR)
+                    if last_question is not None:
+                        st.session_state.current_question = last_question
 
                     if st.session_state.current_question:
                         st.divider()
@@ -419,77 +603,7 @@ def main():
                                 st.warning("Please enter an answer.")
 
             elif game.phase == GamePhase.GUESSING_PHASE:
-                # ============================================================
-                # GUESSING PHASE: Everyone guesses who is human
-                # ============================================================
-                # Participants guess in the same order they answered questions
-                # This maintains consistency with the question/answer flow
-                # ============================================================
-
-                # Add system message when first entering guessing phase
-                if not st.session_state.guessing_phase_announced:
-                    add_chat_message(
-                        "System",
-                        "🎯 Question phase complete! Now it's time to guess who the human is.",
-                        "system",
-                    )
-                    st.session_state.guessing_phase_announced = True
-
-                # Process guesses in answer order
-                answer_order = st.session_state.answer_order
-
-                # Find who needs to guess next (in answer order)
-                next_to_guess = None
-                for color in answer_order:
-                    participant = game.participants[color]
-                    if participant.guess is None:
-                        next_to_guess = color
-                        break
-
-                if next_to_guess:
-                    if next_to_guess == HUMAN_COLOR:
-                        # Human's turn to guess
-                        st.divider()
-                        st.subheader("Guessing Phase - Your Turn")
-                        st.write("Who do you think is the human?")
-
-                        other_participants = [c for c in PARTICIPANT_COLORS if c != HUMAN_COLOR]
-                        guess = st.selectbox(
-                            "Select your guess:",
-                            other_participants,
-                            format_func=lambda x: f"{COLOR_EMOJIS[x]} Mr. {x}",
-                        )
-
-                        reasoning = st.text_area("Explain your reasoning:", placeholder="I think it's Mr. X because...")
-
-                        if st.button("Submit Guess", use_container_width=True):
-                            if reasoning.strip():
-                                handle_human_guess(guess, reasoning)
-                            else:
-                                st.warning("Please provide reasoning for your guess.")
-                    else:
-                        # AI's turn to guess
-                        color = next_to_guess
-                        ai_model = st.session_state.ai_models[color]
-                        conv_history = format_conversation_history()
-                        with st.spinner(f"Mr. {color} is guessing..."):
-                            response = game.invoke_model(
-                                ai_model.model, guessing_prompt, conversation_history=conv_history, target_model=""
-                            )
-                        # Extract the color from the response using regex
-                        # Expected format: "I think Mr. [Color] is the human because..."
-                        guess = color  # Default to self if extraction fails
-                        match = re.search(r"I think Mr\.\s+(\w+)\s+is the human", response, re.IGNORECASE)
-                        if match:
-                            extracted_color = match.group(1)
-                            # Validate that the extracted color is a valid participant
-                            if extracted_color in PARTICIPANT_COLORS:
-                                guess = extracted_color
-                        reasoning = response
-                        game.record_guess(color, guess, reasoning)
-                        add_chat_message(color, f"I think Mr. {guess} is the human. {reasoning}", "guess")
-                        st.rerun()
-                        return
+                guessing_panel()
 
             elif game.phase == GamePhase.FINISHED:
                 # Display results when game is finished
@@ -499,13 +613,12 @@ def main():
                 results = game.get_results()
 
                 # Determine who got the most votes
-                vote_counts = {}
-                for guess in results["guesses"].values():
-                    vote_counts[guess] = vote_counts.get(guess, 0) + 1
+                vote_counts = Counter(results["guesses"].values())
 
                 # Find the participant(s) with the most votes
-                max_votes = max(vote_counts.values()) if vote_counts else 0
-                most_voted = [color for color, count in vote_counts.items() if count == max_votes]
+                ranking = vote_counts.most_common()
+                max_votes = ranking[0][1] if ranking else 0
+                most_voted = [color for color, count in ranking if count == max_votes]
 
                 # Human wins if they are NOT the most voted
                 human_won = results["human_color"] not in most_voted
@@ -514,7 +627,7 @@ def main():
                 if human_won:
                     st.success(f"✅ **HUMAN WINS!** Mr. {results['human_color']} successfully blended in with the AIs!")
                 else:
-                    human_votes = vote_counts.get(results["human_color"], 0)
+                    human_votes = vote_counts[results["human_color"]]
                     st.error(
                         f"❌ **HUMAN LOSES!** Mr. {results['human_color']} was identified as the human "
                         f"(received {human_votes} vote(s))"
@@ -526,7 +639,7 @@ def main():
 
                 # Display vote counts for each participant
                 for color in PARTICIPANT_COLORS:
-                    votes = vote_counts.get(color, 0)
+                    votes = vote_counts[color]
                     emoji = COLOR_EMOJIS[color]
                     is_human = color == results["human_color"]
                     human_tag = " 👤 (HUMAN)" if is_human else ""